@@ -1,18 +1,45 @@
 """Main FastMCP application for Slack MCP Server."""
 
+import asyncio
+import base64
+import logging
 import os
+import queue
+import random
+import time
+from contextlib import aclosing, asynccontextmanager, suppress
+from itertools import islice
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from types import MappingProxyType
+from typing import (
+    Optional, List, Dict, Any, AsyncIterator, Awaitable, Callable, Hashable, Mapping, Tuple,
+    get_type_hints, is_typeddict,
+)
+import aiohttp
+from cachetools import TTLCache
 from mcp.server.fastmcp import FastMCP
 from fastapi import FastAPI, HTTPException
 from fastapi.responses import FileResponse
-from slack_sdk import WebClient
+from slack_sdk.web.async_client import AsyncWebClient
 from slack_sdk.errors import SlackApiError
 
+from .schemas import (
+    ChannelMatch,
+    ChannelSummary,
+    HistoryMessage,
+    SearchMatch,
+    ThreadMessage,
+    UserMatch,
+    UserSummary,
+)
+
 # Get configuration from environment
 SLACK_BOT_TOKEN = os.getenv("SLACK_BOT_TOKEN")
 SLACK_USER_TOKEN = os.getenv("SLACK_USER_TOKEN")
 SLACK_SAFE_SEARCH = os.getenv("SLACK_SAFE_SEARCH", "false").lower() == "true"
+# Newer FastMCP releases no longer read this from the environment themselves
+FASTMCP_LOG_LEVEL = (os.getenv("FASTMCP_LOG_LEVEL") or "INFO").upper()
 
 if not SLACK_BOT_TOKEN:
     raise ValueError("SLACK_BOT_TOKEN environment variable is required")
@@ -20,21 +47,452 @@ if not SLACK_BOT_TOKEN:
 if not SLACK_USER_TOKEN:
     raise ValueError("SLACK_USER_TOKEN environment variable is required")
 
-# Initialize Slack clients
-slack_client = WebClient(token=SLACK_BOT_TOKEN)
-user_client = WebClient(token=SLACK_USER_TOKEN)
+logger = logging.getLogger(__name__)
+
+# Records from this module are handed to a background thread while the app is
+# running (see _start_log_listener), so logging never blocks the event loop on
+# a console write.
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_log_handler = QueueHandler(_log_queue)
+
+
+def _start_log_listener() -> Optional[QueueListener]:
+    """Route this module's records through a queue to the root handlers."""
+    root_handlers = logging.getLogger().handlers
+    if not root_handlers:
+        return None
+    listener = QueueListener(_log_queue, *root_handlers, respect_handler_level=True)
+    listener.start()
+    logger.addHandler(_log_handler)
+    logger.propagate = False
+    return listener
+
+
+def _stop_log_listener(listener: Optional[QueueListener]) -> None:
+    if listener is None:
+        return
+    logger.removeHandler(_log_handler)
+    logger.propagate = True
+    listener.stop()
+
+
+def _slack_client() -> AsyncWebClient:
+    """Bot-token Slack client, created in the app lifespan."""
+    return app.state.slack_client
+
+
+def _user_client() -> AsyncWebClient:
+    """User-token Slack client (needed for search), created in the app lifespan."""
+    return app.state.user_client
+
+
+class AsyncTokenBucket:
+    """Token bucket rate limiter for asyncio.
+
+    Holds up to `capacity` tokens, refilled at `refill_rate` tokens per second.
+    Callers that find the bucket empty wait in FIFO order for the next token.
+    """
+
+    def __init__(self, capacity: float, refill_rate: float):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.refill_rate)
+        self._updated_at = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.refill_rate)
+                self._refill()
+            self._tokens -= 1
+
+    def pause(self, seconds: float) -> None:
+        """Withhold tokens for `seconds`, e.g. after Slack answered with Retry-After."""
+        self._refill()
+        self._tokens = min(self._tokens, 1 - seconds * self.refill_rate)
+
+
+# Requests per minute for each Slack method we call, per Slack's rate limit
+# tiers (https://api.slack.com/apis/rate-limits). chat.postMessage has its own
+# limit of roughly one message per second.
+SLACK_METHOD_RATE_LIMITS = {
+    "chat_postMessage": 60,
+    "conversations_history": 50,   # Tier 3
+    "conversations_info": 50,      # Tier 3
+    "conversations_list": 20,      # Tier 2
+    "conversations_replies": 50,   # Tier 3
+    "reactions_add": 50,           # Tier 3
+    "search_messages": 20,         # Tier 2
+    "users_list": 20,              # Tier 2
+    "users_profile_get": 100,      # Tier 4
+}
+_rate_limiters = {
+    method: AsyncTokenBucket(capacity=rpm, refill_rate=rpm / 60)
+    for method, rpm in SLACK_METHOD_RATE_LIMITS.items()
+}
+MAX_RATE_LIMIT_RETRIES = 3
+
+
+async def _slack_call(method: Callable[..., Awaitable[Any]], **kwargs: Any) -> Any:
+    """Call a Slack client method under its rate limiter.
+
+    A 429 response pauses the method's bucket for the Retry-After period and the
+    call is retried, up to MAX_RATE_LIMIT_RETRIES times.
+    """
+    bucket = _rate_limiters[method.__name__]
+    for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+        await bucket.acquire()
+        try:
+            return await method(**kwargs)
+        except SlackApiError as e:
+            if e.response.status_code != 429 or attempt == MAX_RATE_LIMIT_RETRIES:
+                raise
+            retry_after = float(e.response.headers.get("Retry-After", 1))
+            logger.warning("Rate limited on %s, retrying in %ss", method.__name__, retry_after)
+            bucket.pause(retry_after)
+
+
+# Bounds concurrent users.profile.get calls issued by slack_get_user_profiles
+_profile_semaphore = asyncio.Semaphore(20)
+MAX_PROFILE_USER_IDS = 200
+
+
+def _encode_offset_cursor(offset: int) -> str:
+    return base64.urlsafe_b64encode(str(offset).encode()).decode()
+
+
+def _decode_offset_cursor(cursor: str) -> int:
+    """Decode a cursor produced by _encode_offset_cursor."""
+    try:
+        offset = int(base64.urlsafe_b64decode(cursor.encode()))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if offset < 0:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return offset
+
+
+# Channel ID -> name, used to build the "in:" filter for search.messages
+_channel_name_cache: TTLCache = TTLCache(maxsize=4096, ttl=3600)
+
+# Recent conversations.history / conversations.replies pages, keyed by
+# (channel_id, [thread_ts,] cursor, limit). Short-lived so new messages show up
+# quickly; writes through this server also drop the channel's entries.
+_history_cache: TTLCache = TTLCache(maxsize=1024, ttl=30)
+_replies_cache: TTLCache = TTLCache(maxsize=1024, ttl=30)
+
+
+# In-flight fetches keyed by (cache, key) so concurrent misses share one Slack call
+_inflight: Dict[Any, asyncio.Future] = {}
+
+
+def _invalidate_channel_messages(channel_id: str) -> None:
+    """Drop cached history and thread pages for a channel after a write.
+
+    Fetches already in flight may predate the write, so they are dropped from
+    _inflight too: later reads start a fresh fetch instead of joining them,
+    and _cached_fetch does not cache their result.
+    """
+    for cache in (_history_cache, _replies_cache):
+        for key in [key for key in cache if key[0] == channel_id]:
+            cache.pop(key, None)
+        for inflight_key in [
+            inflight_key for inflight_key in _inflight
+            if inflight_key[0] == id(cache) and inflight_key[1][0] == channel_id
+        ]:
+            del _inflight[inflight_key]
+
+
+async def _cached_fetch(cache: TTLCache, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+    """Return cache[key], calling fetch() on a miss.
+
+    Concurrent misses for the same key await a single fetch. None results are
+    not cached so that transient failures are retried on the next call.
+    """
+    try:
+        return cache[key]
+    except KeyError:
+        pass
+
+    inflight_key = (id(cache), key)
+    future = _inflight.get(inflight_key)
+    if future is None:
+        future = asyncio.ensure_future(fetch())
+        _inflight[inflight_key] = future
+        try:
+            value = await asyncio.shield(future)
+        finally:
+            # No longer registered if invalidated meanwhile (or replaced by a newer fetch)
+            current = _inflight.get(inflight_key) is future
+            if current:
+                del _inflight[inflight_key]
+        if current and value is not None:
+            cache[key] = value
+        return value
+    return await asyncio.shield(future)
+
+
+async def _fetch_channel_name(channel_id: str) -> Optional[str]:
+    """Resolve a channel ID to its name via conversations.info."""
+    channel_info = await _slack_call(_slack_client().conversations_info, channel=channel_id)
+    if channel_info["ok"]:
+        return channel_info.get("channel", {}).get("name")
+    return None
+
+
+# Shared read-only stand-in for missing nested objects in Slack payloads
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+def _make_projector(
+    schema: type, sources: Optional[Mapping[str, str]] = None
+) -> Callable[[Mapping[str, Any]], Dict[str, Any]]:
+    """Compile a function that copies `schema`'s fields out of a Slack record.
+
+    Fields default to the key of the same name, and missing keys become None.
+    Fields typed as a nested TypedDict are projected from the nested object.
+    `sources` maps a top-level field to a dotted path in the record instead,
+    e.g. {"email": "profile.email"}.
+
+    The generated function is a single dict display over pre-bound .get
+    methods, so building a response does no per-field dispatch.
+    """
+    sources = sources or {}
+    getters: Dict[Tuple[str, ...], str] = {(): "g"}
+    setup: List[str] = []
+
+    def getter(path: Tuple[str, ...]) -> str:
+        if path not in getters:
+            parent = getter(path[:-1])
+            name = f"g{len(getters)}"
+            setup.append(f"    {name} = ({parent}({path[-1]!r}) or _EMPTY).get")
+            getters[path] = name
+        return getters[path]
+
+    def build(schema: type, prefix: Tuple[str, ...]) -> str:
+        items = []
+        for field, annotation in get_type_hints(schema).items():
+            if not prefix and field in sources:
+                path = tuple(sources[field].split("."))
+            else:
+                path = prefix + (field,)
+            if is_typeddict(annotation):
+                value = build(annotation, path)
+            else:
+                value = f"{getter(path[:-1])}({path[-1]!r})"
+            items.append(f"{field!r}: {value}")
+        return "{" + ", ".join(items) + "}"
+
+    body = build(schema, ())
+    source = "\n".join([
+        "def project(record):",
+        "    g = record.get",
+        *setup,
+        f"    return {body}",
+    ])
+    namespace: Dict[str, Any] = {"_EMPTY": _EMPTY}
+    exec(compile(source, f"<projector {schema.__name__}>", "exec"), namespace)
+    return namespace["project"]
+
+
+# Response builders for each tool, generated from the schemas in schemas.py
+_project_channel = _make_projector(ChannelSummary)
+_project_channel_match = _make_projector(ChannelMatch, {"purpose": "purpose.value"})
+_project_history_message = _make_projector(HistoryMessage)
+_project_thread_message = _make_projector(ThreadMessage)
+_project_search_match = _make_projector(SearchMatch)
+_project_user = _make_projector(UserSummary)
+_project_user_match = _make_projector(
+    UserMatch, {"display_name": "profile.display_name", "email": "profile.email"}
+)
+
+
+# Workspace channel/user directories, refreshed in the background by
+# _refresh_directory_loop. None until the first refresh completes, which a
+# search on a cold cache waits for.
+# Entries are (record, search_text) pairs holding only active channels/users,
+# with search_text lowercased once at refresh time so a search is a single
+# substring test per record.
+DIRECTORY_REFRESH_SECONDS = 300
+_channels_cache: Optional[List[Tuple[Dict[str, Any], str]]] = None
+_users_cache: Optional[List[Tuple[Dict[str, Any], str]]] = None
+# ID -> name for every public channel, archived ones included
+_channel_name_by_id: Dict[str, str] = {}
+_channels_refreshed_at: Optional[float] = None
+_users_refreshed_at: Optional[float] = None
+# Refresh currently running for each directory ("channels" / "users"), shared
+# by everyone who needs it
+_directory_refreshes: Dict[str, asyncio.Task] = {}
+
+
+def _channel_search_text(ch: Dict[str, Any]) -> str:
+    return (ch.get("name") or "").lower()
+
+
+def _user_search_text(user: Dict[str, Any]) -> str:
+    # NUL separators keep a query from matching across field boundaries
+    return "\0".join((
+        user.get("name") or "",
+        user.get("real_name") or "",
+        (user.get("profile") or {}).get("display_name") or "",
+    )).lower()
+
+
+async def _paginate(
+    method: Callable[..., Awaitable[Any]], key: str, **kwargs: Any
+) -> AsyncIterator[Dict[str, Any]]:
+    """Yield the `key` items of every page of a cursor-paginated Slack method.
+
+    Each page is requested through _slack_call, so pagination stays under the
+    method's rate limiter. The next page is requested as soon as its cursor
+    is known, overlapping that round trip with the consumer's work on the
+    current page.
+    """
+    pending: Optional[asyncio.Future] = None
+    try:
+        response = await _slack_call(method, cursor=None, **kwargs)
+        while True:
+            cursor = (response.get("response_metadata") or _EMPTY).get("next_cursor")
+            if cursor:
+                pending = asyncio.ensure_future(_slack_call(method, cursor=cursor, **kwargs))
+            for item in response.get(key, []):
+                yield item
+            if not cursor:
+                return
+            response, pending = await pending, None
+    finally:
+        if pending is not None and not pending.cancel() and not pending.cancelled():
+            # Already finished: retrieve any error so it is not reported as unhandled
+            pending.exception()
+
+
+async def _load_channels() -> None:
+    """Fetch every public channel and swap in new search entries and ID -> name map."""
+    global _channels_cache, _channel_name_by_id, _channels_refreshed_at
+    entries = []
+    names = {}
+    async with aclosing(_paginate(
+        _slack_client().conversations_list, "channels", limit=200, types="public_channel"
+    )) as channels:
+        async for ch in channels:
+            if ch.get("id") and ch.get("name"):
+                names[ch["id"]] = ch["name"]
+            if not ch.get("is_archived", False):
+                entries.append((ch, _channel_search_text(ch)))
+    _channels_cache = entries
+    _channel_name_by_id = names
+    _channels_refreshed_at = time.monotonic()
+
+
+async def _load_users() -> None:
+    """Fetch every user and swap in new search entries for active ones."""
+    global _users_cache, _users_refreshed_at
+    entries = []
+    async with aclosing(_paginate(_slack_client().users_list, "members", limit=200)) as users:
+        async for user in users:
+            if not user.get("deleted", False):
+                entries.append((user, _user_search_text(user)))
+    _users_cache = entries
+    _users_refreshed_at = time.monotonic()
+
+
+def _format_channel_matches(channels: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Build the slack_search_channels response."""
+    return {
+        "channels": list(map(_project_channel_match, channels)),
+        "total": len(channels)
+    }
+
+
+def _format_user_matches(users: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Build the slack_search_users response."""
+    return {
+        "users": list(map(_project_user_match, users)),
+        "total": len(users)
+    }
+
+
+def _log_refresh_failure(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Failed to refresh Slack directory cache", exc_info=task.exception())
+
+
+def _start_refresh(name: str, load: Callable[[], Awaitable[None]]) -> asyncio.Task:
+    """Start reloading one directory, or return the reload already in flight.
+
+    Concurrent callers share a single full-workspace pagination. Failures are
+    logged here, so callers need not await the task.
+    """
+    task = _directory_refreshes.get(name)
+    if task is None or task.done():
+        task = asyncio.create_task(load())
+        task.add_done_callback(_log_refresh_failure)
+        _directory_refreshes[name] = task
+    return task
+
+
+def _refresh_channels() -> asyncio.Task:
+    return _start_refresh("channels", _load_channels)
+
+
+def _refresh_users() -> asyncio.Task:
+    return _start_refresh("users", _load_users)
+
+
+def _is_stale(refreshed_at: Optional[float]) -> bool:
+    """Whether a directory is missing or older than background refreshes allow."""
+    return refreshed_at is None or time.monotonic() - refreshed_at > 2 * DIRECTORY_REFRESH_SECONDS
+
+
+async def _refresh_directory_loop() -> None:
+    """Keep the directory caches warm for the lifetime of the app."""
+    while True:
+        # Failures are logged by _start_refresh; keep going on the next round
+        await asyncio.gather(
+            asyncio.shield(_refresh_channels()),
+            asyncio.shield(_refresh_users()),
+            return_exceptions=True
+        )
+        # Jitter so multiple replicas do not refresh in lockstep
+        await asyncio.sleep(DIRECTORY_REFRESH_SECONDS * random.uniform(0.9, 1.1))
+
+
+async def _cancel_directory_refreshes() -> None:
+    """Stop in-flight directory refreshes, e.g. before the HTTP session closes."""
+    tasks = list(_directory_refreshes.values())
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _is_private_match(msg: Dict[str, Any]) -> bool:
+    """Whether a search match comes from a private channel, DM or group DM."""
+    ch = msg.get("channel") or _EMPTY
+    return bool(ch.get("is_private") or ch.get("is_im") or ch.get("is_mpim"))
 
-if SLACK_SAFE_SEARCH:
-    print("Safe search mode enabled: Private channels and DMs will be excluded from search results")
 
 STATIC_DIR = Path(__file__).parent / "static"
+# The static bundle ships with the package, so check for it once at import
+INDEX_PATH: Optional[Path] = STATIC_DIR / "index.html" if (STATIC_DIR / "index.html").is_file() else None
 
 # Create an MCP server
-mcp = FastMCP("Slack MCP Server on Databricks Apps")
+mcp = FastMCP("Slack MCP Server on Databricks Apps", log_level=FASTMCP_LOG_LEVEL)
+
+# Logged only now: creating FastMCP is what configures the root logger
+if SLACK_SAFE_SEARCH:
+    logger.info("Safe search mode enabled: Private channels and DMs will be excluded from search results")
 
 
 @mcp.tool()
-def slack_list_channels(
+async def slack_list_channels(
     limit: int = 100,
     cursor: Optional[str] = None
 ) -> Dict[str, Any]:
@@ -48,7 +506,8 @@ def slack_list_channels(
         Dictionary containing channels list and pagination info
     """
     try:
-        response = slack_client.conversations_list(
+        response = await _slack_call(
+            _slack_client().conversations_list,
             limit=limit,
             cursor=cursor,
             types="public_channel"
@@ -58,23 +517,15 @@ def slack_list_channels(
             raise HTTPException(status_code=400, detail=f"Slack API error: {response.get('error')}")
         
         return {
-            "channels": [
-                {
-                    "id": ch.get("id"),
-                    "name": ch.get("name"),
-                    "is_archived": ch.get("is_archived"),
-                    "num_members": ch.get("num_members")
-                }
-                for ch in response.get("channels", [])
-            ],
-            "response_metadata": response.get("response_metadata", {})
+            "channels": list(map(_project_channel, response.get("channels", []))),
+            "response_metadata": response.get("response_metadata") or {}
         }
     except SlackApiError as e:
         raise HTTPException(status_code=400, detail=f"Slack API error: {str(e)}")
 
 
 @mcp.tool()
-def slack_post_message(
+async def slack_post_message(
     channel_id: str,
     text: str
 ) -> str:
@@ -88,7 +539,8 @@ def slack_post_message(
         Success message
     """
     try:
-        response = slack_client.chat_postMessage(
+        response = await _slack_call(
+            _slack_client().chat_postMessage,
             channel=channel_id,
             text=text
         )
@@ -96,13 +548,14 @@ def slack_post_message(
         if not response["ok"]:
             raise HTTPException(status_code=400, detail=f"Slack API error: {response.get('error')}")
         
+        _invalidate_channel_messages(channel_id)
         return "Message posted successfully"
     except SlackApiError as e:
         raise HTTPException(status_code=400, detail=f"Slack API error: {str(e)}")
 
 
 @mcp.tool()
-def slack_reply_to_thread(
+async def slack_reply_to_thread(
     channel_id: str,
     thread_ts: str,
     text: str
@@ -118,7 +571,8 @@ def slack_reply_to_thread(
         Success message
     """
     try:
-        response = slack_client.chat_postMessage(
+        response = await _slack_call(
+            _slack_client().chat_postMessage,
             channel=channel_id,
             thread_ts=thread_ts,
             text=text
@@ -127,13 +581,14 @@ def slack_reply_to_thread(
         if not response["ok"]:
             raise HTTPException(status_code=400, detail=f"Slack API error: {response.get('error')}")
         
+        _invalidate_channel_messages(channel_id)
         return "Reply sent to thread successfully"
     except SlackApiError as e:
         raise HTTPException(status_code=400, detail=f"Slack API error: {str(e)}")
 
 
 @mcp.tool()
-def slack_add_reaction(
+async def slack_add_reaction(
     channel_id: str,
     timestamp: str,
     reaction: str
@@ -149,7 +604,8 @@ def slack_add_reaction(
         Success message
     """
     try:
-        response = slack_client.reactions_add(
+        response = await _slack_call(
+            _slack_client().reactions_add,
             channel=channel_id,
             timestamp=timestamp,
             name=reaction
@@ -158,13 +614,14 @@ def slack_add_reaction(
         if not response["ok"]:
             raise HTTPException(status_code=400, detail=f"Slack API error: {response.get('error')}")
         
+        _invalidate_channel_messages(channel_id)
         return "Reaction added successfully"
     except SlackApiError as e:
         raise HTTPException(status_code=400, detail=f"Slack API error: {str(e)}")
 
 
 @mcp.tool()
-def slack_get_channel_history(
+async def slack_get_channel_history(
     channel_id: str,
     limit: int = 100,
     cursor: Optional[str] = None
@@ -186,8 +643,9 @@ def slack_get_channel_history(
     Returns:
         Dictionary containing messages and pagination info
     """
-    try:
-        response = slack_client.conversations_history(
+    async def fetch() -> Dict[str, Any]:
+        response = await _slack_call(
+            _slack_client().conversations_history,
             channel=channel_id,
             limit=limit,
             cursor=cursor
@@ -197,27 +655,19 @@ def slack_get_channel_history(
             raise HTTPException(status_code=400, detail=f"Slack API error: {response.get('error')}")
         
         return {
-            "messages": [
-                {
-                    "type": msg.get("type"),
-                    "user": msg.get("user"),
-                    "text": msg.get("text"),
-                    "ts": msg.get("ts"),
-                    "thread_ts": msg.get("thread_ts"),
-                    "reply_count": msg.get("reply_count"),
-                    "reactions": msg.get("reactions")
-                }
-                for msg in response.get("messages", [])
-            ],
+            "messages": list(map(_project_history_message, response.get("messages", []))),
             "has_more": response.get("has_more", False),
-            "response_metadata": response.get("response_metadata", {})
+            "response_metadata": response.get("response_metadata") or {}
         }
+    
+    try:
+        return await _cached_fetch(_history_cache, (channel_id, cursor, limit), fetch)
     except SlackApiError as e:
         raise HTTPException(status_code=400, detail=f"Slack API error: {str(e)}")
 
 
 @mcp.tool()
-def slack_get_thread_replies(
+async def slack_get_thread_replies(
     channel_id: str,
     thread_ts: str,
     limit: int = 100,
@@ -234,8 +684,9 @@ def slack_get_thread_replies(
     Returns:
         Dictionary containing thread replies and pagination info
     """
-    try:
-        response = slack_client.conversations_replies(
+    async def fetch() -> Dict[str, Any]:
+        response = await _slack_call(
+            _slack_client().conversations_replies,
             channel=channel_id,
             ts=thread_ts,
             limit=limit,
@@ -246,25 +697,19 @@ def slack_get_thread_replies(
             raise HTTPException(status_code=400, detail=f"Slack API error: {response.get('error')}")
         
         return {
-            "messages": [
-                {
-                    "type": msg.get("type"),
-                    "user": msg.get("user"),
-                    "text": msg.get("text"),
-                    "ts": msg.get("ts"),
-                    "thread_ts": msg.get("thread_ts")
-                }
-                for msg in response.get("messages", [])
-            ],
+            "messages": list(map(_project_thread_message, response.get("messages", []))),
             "has_more": response.get("has_more", False),
-            "response_metadata": response.get("response_metadata", {})
+            "response_metadata": response.get("response_metadata") or {}
         }
+    
+    try:
+        return await _cached_fetch(_replies_cache, (channel_id, thread_ts, cursor, limit), fetch)
     except SlackApiError as e:
         raise HTTPException(status_code=400, detail=f"Slack API error: {str(e)}")
 
 
 @mcp.tool()
-def slack_get_users(
+async def slack_get_users(
     limit: int = 100,
     cursor: Optional[str] = None
 ) -> Dict[str, Any]:
@@ -278,7 +723,8 @@ def slack_get_users(
         Dictionary containing users list and pagination info
     """
     try:
-        response = slack_client.users_list(
+        response = await _slack_call(
+            _slack_client().users_list,
             limit=limit,
             cursor=cursor
         )
@@ -287,66 +733,67 @@ def slack_get_users(
             raise HTTPException(status_code=400, detail=f"Slack API error: {response.get('error')}")
         
         return {
-            "members": [
-                {
-                    "id": user.get("id"),
-                    "name": user.get("name"),
-                    "real_name": user.get("real_name"),
-                    "profile": {
-                        "display_name": user.get("profile", {}).get("display_name"),
-                        "email": user.get("profile", {}).get("email"),
-                        "image_48": user.get("profile", {}).get("image_48")
-                    },
-                    "is_bot": user.get("is_bot"),
-                    "deleted": user.get("deleted")
-                }
-                for user in response.get("members", [])
-            ],
-            "response_metadata": response.get("response_metadata", {})
+            "members": list(map(_project_user, response.get("members", []))),
+            "response_metadata": response.get("response_metadata") or {}
         }
     except SlackApiError as e:
         raise HTTPException(status_code=400, detail=f"Slack API error: {str(e)}")
 
 
 @mcp.tool()
-def slack_get_user_profiles(
-    user_ids: List[str]
+async def slack_get_user_profiles(
+    user_ids: List[str],
+    limit: int = 50,
+    cursor: Optional[str] = None
 ) -> Dict[str, Any]:
     """Get multiple users' profile information in bulk.
     
+    At most 200 user IDs are accepted per call. Profiles are returned `limit`
+    at a time; pass the returned next_cursor with the same user_ids to get
+    the next batch.
+    
     Args:
-        user_ids: List of user IDs to fetch profiles for
+        user_ids: List of user IDs to fetch profiles for (max 200)
+        limit: Maximum number of profiles to return (default: 50)
+        cursor: Pagination cursor for next page
         
     Returns:
-        Dictionary containing profiles with user_id as key
+        Dictionary containing profiles and pagination info
     """
-    profiles = []
+    if len(user_ids) > MAX_PROFILE_USER_IDS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many user IDs: at most {MAX_PROFILE_USER_IDS} are allowed per call"
+        )
+    if limit < 1:
+        raise HTTPException(status_code=400, detail="limit must be at least 1")
     
-    for user_id in user_ids:
-        try:
-            response = slack_client.users_profile_get(user=user_id)
-            
+    start = _decode_offset_cursor(cursor) if cursor else 0
+    end = start + limit
+    
+    async def fetch_profile(user_id: str) -> Dict[str, Any]:
+        async with _profile_semaphore:
+            try:
+                response = await _slack_call(_slack_client().users_profile_get, user=user_id)
+            except SlackApiError as e:
+                return {"user_id": user_id, "error": str(e)}
+
             if response["ok"]:
-                profiles.append({
-                    "user_id": user_id,
-                    "profile": response.get("profile", {})
-                })
-            else:
-                profiles.append({
-                    "user_id": user_id,
-                    "error": response.get("error", "Unknown error")
-                })
-        except SlackApiError as e:
-            profiles.append({
-                "user_id": user_id,
-                "error": str(e)
-            })
+                return {"user_id": user_id, "profile": response.get("profile", {})}
+            return {"user_id": user_id, "error": response.get("error", "Unknown error")}
+
+    profiles = await asyncio.gather(*(fetch_profile(user_id) for user_id in user_ids[start:end]))
     
-    return {"profiles": profiles}
+    return {
+        "profiles": list(profiles),
+        "response_metadata": {
+            "next_cursor": _encode_offset_cursor(end) if end < len(user_ids) else ""
+        }
+    }
 
 
 @mcp.tool()
-def slack_search_messages(
+async def slack_search_messages(
     query: Optional[str] = None,
     in_channel: Optional[str] = None,
     from_user: Optional[str] = None,
@@ -393,10 +840,13 @@ def slack_search_messages(
         
         # Add channel filter
         if in_channel:
-            # Resolve channel name from ID
-            channel_info = slack_client.conversations_info(channel=in_channel)
-            if channel_info["ok"] and channel_info.get("channel", {}).get("name"):
-                search_query += f" in:{channel_info['channel']['name']}"
+            # Resolve channel name from ID, asking Slack only for channels
+            # missing from the directory cache (e.g. private channels)
+            channel_name = _channel_name_by_id.get(in_channel) or await _cached_fetch(
+                _channel_name_cache, in_channel, lambda: _fetch_channel_name(in_channel)
+            )
+            if channel_name:
+                search_query += f" in:{channel_name}"
         
         # Add user filter
         if from_user:
@@ -413,9 +863,10 @@ def slack_search_messages(
             search_query += f" during:{during}"
         
         search_query = search_query.strip()
-        print(f"Search query: {search_query}")
+        logger.debug("Search query: %s", search_query)
         
-        response = user_client.search_messages(
+        response = await _slack_call(
+            _user_client().search_messages,
             query=search_query,
             highlight=highlight,
             sort=sort,
@@ -427,40 +878,22 @@ def slack_search_messages(
         if not response["ok"]:
             raise HTTPException(status_code=400, detail=f"Slack API error: {response.get('error')}")
         
+        messages = response.get("messages") or _EMPTY
+        matches = messages.get("matches") or []
+        
         # Apply safe search filtering if enabled
-        matches = response.get("messages", {}).get("matches", [])
         if SLACK_SAFE_SEARCH:
             original_count = len(matches)
-            matches = [
-                msg for msg in matches
-                if not (
-                    msg.get("channel", {}).get("is_private") or
-                    msg.get("channel", {}).get("is_im") or
-                    msg.get("channel", {}).get("is_mpim")
-                )
-            ]
-            filtered_count = original_count - len(matches)
-            if filtered_count > 0:
-                print(f"Safe search: Filtered out {filtered_count} messages from private channels/DMs")
+            matches = [msg for msg in matches if not _is_private_match(msg)]
+            if logger.isEnabledFor(logging.INFO):
+                filtered_count = original_count - len(matches)
+                if filtered_count > 0:
+                    logger.info("Safe search: Filtered out %d messages from private channels/DMs", filtered_count)
         
         return {
             "messages": {
-                "total": response.get("messages", {}).get("total", 0),
-                "matches": [
-                    {
-                        "type": msg.get("type"),
-                        "user": msg.get("user"),
-                        "username": msg.get("username"),
-                        "text": msg.get("text"),
-                        "ts": msg.get("ts"),
-                        "channel": {
-                            "id": msg.get("channel", {}).get("id"),
-                            "name": msg.get("channel", {}).get("name")
-                        },
-                        "permalink": msg.get("permalink")
-                    }
-                    for msg in matches
-                ]
+                "total": messages.get("total", 0),
+                "matches": list(map(_project_search_match, matches))
             }
         }
     except SlackApiError as e:
@@ -468,7 +901,7 @@ def slack_search_messages(
 
 
 @mcp.tool()
-def slack_search_channels(
+async def slack_search_channels(
     query: str,
     limit: int = 20
 ) -> Dict[str, Any]:
@@ -484,54 +917,25 @@ def slack_search_channels(
         Dictionary containing matching channels
     """
     try:
-        # Fetch all channels
-        all_channels = []
-        cursor = None
+        if _channels_cache is None:
+            # Cold start: wait for the shared refresh rather than paginate here
+            await asyncio.shield(_refresh_channels())
+        elif _is_stale(_channels_refreshed_at):
+            # Background refreshes keep failing: retry, but search the stale cache
+            _refresh_channels()
         
-        while True:
-            response = slack_client.conversations_list(
-                limit=200,
-                cursor=cursor,
-                types="public_channel"
-            )
-            
-            if not response["ok"]:
-                raise HTTPException(status_code=400, detail=f"Slack API error: {response.get('error')}")
-            
-            all_channels.extend(response.get("channels", []))
-            
-            cursor = response.get("response_metadata", {}).get("next_cursor")
-            if not cursor:
-                break
-        
-        # Filter by query
         query_lower = query.lower()
-        matching_channels = [
-            ch for ch in all_channels
-            if query_lower in ch.get("name", "").lower() and not ch.get("is_archived", False)
-        ]
-        
-        # Limit results
-        matching_channels = matching_channels[:limit]
+        matching_channels = list(islice(
+            (ch for ch, text in _channels_cache if query_lower in text), max(limit, 0)
+        ))
         
-        return {
-            "channels": [
-                {
-                    "id": ch.get("id"),
-                    "name": ch.get("name"),
-                    "num_members": ch.get("num_members"),
-                    "purpose": ch.get("purpose", {}).get("value")
-                }
-                for ch in matching_channels
-            ],
-            "total": len(matching_channels)
-        }
+        return _format_channel_matches(matching_channels)
     except SlackApiError as e:
         raise HTTPException(status_code=400, detail=f"Slack API error: {str(e)}")
 
 
 @mcp.tool()
-def slack_search_users(
+async def slack_search_users(
     query: str,
     limit: int = 20
 ) -> Dict[str, Any]:
@@ -547,53 +951,19 @@ def slack_search_users(
         Dictionary containing matching users
     """
     try:
-        # Fetch all users
-        all_users = []
-        cursor = None
+        if _users_cache is None:
+            # Cold start: wait for the shared refresh rather than paginate here
+            await asyncio.shield(_refresh_users())
+        elif _is_stale(_users_refreshed_at):
+            # Background refreshes keep failing: retry, but search the stale cache
+            _refresh_users()
         
-        while True:
-            response = slack_client.users_list(
-                limit=200,
-                cursor=cursor
-            )
-            
-            if not response["ok"]:
-                raise HTTPException(status_code=400, detail=f"Slack API error: {response.get('error')}")
-            
-            all_users.extend(response.get("members", []))
-            
-            cursor = response.get("response_metadata", {}).get("next_cursor")
-            if not cursor:
-                break
-        
-        # Filter by query
         query_lower = query.lower()
-        matching_users = [
-            user for user in all_users
-            if not user.get("deleted", False) and (
-                query_lower in user.get("name", "").lower() or
-                query_lower in user.get("real_name", "").lower() or
-                query_lower in user.get("profile", {}).get("display_name", "").lower()
-            )
-        ]
-        
-        # Limit results
-        matching_users = matching_users[:limit]
+        matching_users = list(islice(
+            (user for user, text in _users_cache if query_lower in text), max(limit, 0)
+        ))
         
-        return {
-            "users": [
-                {
-                    "id": user.get("id"),
-                    "name": user.get("name"),
-                    "real_name": user.get("real_name"),
-                    "display_name": user.get("profile", {}).get("display_name"),
-                    "email": user.get("profile", {}).get("email"),
-                    "is_bot": user.get("is_bot")
-                }
-                for user in matching_users
-            ],
-            "total": len(matching_users)
-        }
+        return _format_user_matches(matching_users)
     except SlackApiError as e:
         raise HTTPException(status_code=400, detail=f"Slack API error: {str(e)}")
 
@@ -601,25 +971,54 @@ def slack_search_users(
 # Create the MCP app
 mcp_app = mcp.streamable_http_app()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Set up the Slack clients, then run the MCP session manager and the
+    directory refresh task."""
+    # One pooled session for both clients so connections (and their TLS
+    # handshakes) are reused across calls; without it AsyncWebClient opens a
+    # new session per request.
+    connector = aiohttp.TCPConnector(limit=100, limit_per_host=20)
+    log_listener = _start_log_listener()
+    try:
+        async with aiohttp.ClientSession(connector=connector) as session:
+            app.state.slack_client = AsyncWebClient(token=SLACK_BOT_TOKEN, session=session)
+            app.state.user_client = AsyncWebClient(token=SLACK_USER_TOKEN, session=session)
+            refresh_task = asyncio.create_task(_refresh_directory_loop())
+            try:
+                async with mcp.session_manager.run():
+                    yield
+            finally:
+                refresh_task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await refresh_task
+                # Refreshes run shielded from the loop, so stop them explicitly
+                # while the session they use is still open
+                await _cancel_directory_refreshes()
+    finally:
+        _stop_log_listener(log_listener)
+
+
 # Create the main FastAPI app
 app = FastAPI(
     title="Slack MCP Server on Databricks Apps",
     description="A Model Context Protocol server for Slack API integration",
     version="0.1.4",
-    lifespan=lambda _: mcp.session_manager.run(),
+    lifespan=lifespan,
 )
 
 
 @app.get("/", include_in_schema=False)
 async def serve_index():
     """Serve the index page."""
-    if STATIC_DIR.exists() and (STATIC_DIR / "index.html").exists():
-        return FileResponse(STATIC_DIR / "index.html")
+    if INDEX_PATH is not None:
+        return FileResponse(INDEX_PATH)
     return {"message": "Slack MCP Server is running", "version": "0.1.4"}
 
 
 @app.get("/health")
-async def health_check():
+async def health_check() -> Dict[str, str]:
     """Health check endpoint."""
     return {
         "status": "ok",
@@ -0,0 +1,97 @@
+"""Response schemas for the Slack MCP tools.
+
+Each TypedDict describes the projection a tool returns for one Slack API
+record: the fields it copies out, in response order. Slack omits unset
+fields, so every value may be None.
+"""
+
+from typing import Any, Dict, List, Optional, TypedDict
+
+
+class ChannelSummary(TypedDict):
+    """Channel entry returned by slack_list_channels."""
+
+    id: Optional[str]
+    name: Optional[str]
+    is_archived: Optional[bool]
+    num_members: Optional[int]
+
+
+class ChannelMatch(TypedDict):
+    """Channel entry returned by slack_search_channels."""
+
+    id: Optional[str]
+    name: Optional[str]
+    num_members: Optional[int]
+    purpose: Optional[str]
+
+
+class HistoryMessage(TypedDict):
+    """Message returned by slack_get_channel_history."""
+
+    type: Optional[str]
+    user: Optional[str]
+    text: Optional[str]
+    ts: Optional[str]
+    thread_ts: Optional[str]
+    reply_count: Optional[int]
+    reactions: Optional[List[Dict[str, Any]]]
+
+
+class ThreadMessage(TypedDict):
+    """Message returned by slack_get_thread_replies."""
+
+    type: Optional[str]
+    user: Optional[str]
+    text: Optional[str]
+    ts: Optional[str]
+    thread_ts: Optional[str]
+
+
+class SearchMatchChannel(TypedDict):
+    """Channel a search match was found in."""
+
+    id: Optional[str]
+    name: Optional[str]
+
+
+class SearchMatch(TypedDict):
+    """Message returned by slack_search_messages."""
+
+    type: Optional[str]
+    user: Optional[str]
+    username: Optional[str]
+    text: Optional[str]
+    ts: Optional[str]
+    channel: SearchMatchChannel
+    permalink: Optional[str]
+
+
+class UserProfileSummary(TypedDict):
+    """Profile fields included with each user from slack_get_users."""
+
+    display_name: Optional[str]
+    email: Optional[str]
+    image_48: Optional[str]
+
+
+class UserSummary(TypedDict):
+    """User entry returned by slack_get_users."""
+
+    id: Optional[str]
+    name: Optional[str]
+    real_name: Optional[str]
+    profile: UserProfileSummary
+    is_bot: Optional[bool]
+    deleted: Optional[bool]
+
+
+class UserMatch(TypedDict):
+    """User entry returned by slack_search_users."""
+
+    id: Optional[str]
+    name: Optional[str]
+    real_name: Optional[str]
+    display_name: Optional[str]
+    email: Optional[str]
+    is_bot: Optional[bool]